@@ -214,8 +214,10 @@ import os
 import numbers
 import ctypes
 import platform
-from copy import deepcopy
 from typing import NamedTuple, Any, Callable, Optional
+from collections import OrderedDict, deque
+from operator import attrgetter
+from functools import partial
 import numpy as np
 from itertools import chain
 # Local
@@ -228,6 +230,9 @@ from cobaya.tools import getfullargspec, get_class_methods, get_properties, \
 from cobaya.theory import HelperTheory
 from cobaya.typing import InfoDict, empty_dict
 
+# Name of the compiled CAMB library
+_camb_lib_fname = "cambdll.dll" if platform.system() == "Windows" else "camblib.so"
+
 
 # Result collector
 class Collector(NamedTuple):
@@ -254,11 +259,17 @@ class CAMB(BoltzmannBase):
     _camb_repo_version = os.environ.get("CAMB_REPO_VERSION", "master")
     _camb_min_gcc_version = "6.4"
     _min_camb_version = '1.5.0'
+    # Argument names of CAMBparams methods, indexed by method (shared by all instances)
+    _camb_method_args: dict = {}
+    # CMB spectra returned, and their column in CAMB's total/unlensed_total Cl arrays
+    _cl_columns = (("tt", 0), ("ee", 1), ("bb", 2), ("te", 3), ("et", 3))
 
     file_base_name = 'camb'
     external_primordial_pk: bool
     camb: Any
     ignore_obsolete: bool
+    transfers_cache_size: int
+    transfers_cache_digits: int
 
     def initialize(self):
         """Importing CAMB from the correct path, if given."""
@@ -289,8 +300,19 @@ class CAMB(BoltzmannBase):
         self.non_linear_sources = False
         self.non_linear_pk = False
         self._base_params = None
+        # Arguments and result of the last successful call to ``set``
+        self._last_set = None
         self._needs_lensing_cross = False
         self._sigmaR_z_indices = {}
+        # Cache of ell-dependent rescaling factors for Cl's, indexed by number of ell's
+        self._cl_ell_factors = {}
+        # Source names of the terms of CAMB's source Cl's, e.g. "W1xP" -> (name, "P"),
+        # filled when source_Cl is requested
+        self._source_cl_terms = {}
+        # Collector calls, with keyword args bound: (product, method, args, post)
+        self._collector_calls = []
+        # Functions to extract each derived parameter from the CAMB results
+        self._derived_getters = {}
 
         if self.external_primordial_pk:
             self.extra_args['initial_power_model'] \
@@ -430,7 +452,9 @@ class CAMB(BoltzmannBase):
             elif k in ("angular_diameter_distance", "comoving_radial_distance"):
                 self.set_collector_with_z_pool(k, v["z"], getattr(CAMBdata, k))
             elif k == "angular_diameter_distance_2":
-                check_module_version(self.camb, '1.3.5')
+                # already guaranteed by the minimum version, unless that check was skipped
+                if self.ignore_obsolete:
+                    check_module_version(self.camb, '1.3.5')
                 self.set_collector_with_z_pool(
                     k, v["z_pairs"], CAMBdata.angular_diameter_distance2, d=2)
             elif k == "sigma8_z":
@@ -457,7 +481,7 @@ class CAMB(BoltzmannBase):
 
                 def get_sigmaR(results, **tmp):
                     _indices = self._sigmaR_z_indices.get(var_pair)
-                    if _indices is None or list(_indices) == []:
+                    if _indices is None or not len(_indices):
                         z_indices = []
                         calc = np.array(results.Params.Transfer.PK_redshifts[
                                         :results.Params.Transfer.PK_num_redshifts])
@@ -506,6 +530,14 @@ class CAMB(BoltzmannBase):
                     # checked that old info == new info
                     if source not in self.sources:
                         self.sources[source] = window
+                # CAMB labels as "AxB", A and B being "P" or "W[i]" (i-th source, from 1)
+                labels = {"P": "P"}
+                labels.update(("W%d" % (i + 1), source)
+                              for i, source in enumerate(self.sources))
+                self._source_cl_terms = {
+                    label1 + "x" + label2: (source1, source2)
+                    for label1, source1 in labels.items()
+                    for label2, source2 in labels.items()}
                 self.limber = v.get("limber", True)
                 self.non_linear_sources = self.non_linear_sources or \
                                           v.get("non_linear", False)
@@ -532,6 +564,10 @@ class CAMB(BoltzmannBase):
                 raise LoggedError(self.log, "This should not be happening. Contact the "
                                             "developers.")
         self.check_no_repeated_input_extra()
+        self._collector_calls = [
+            (product, partial(collector.method, **collector.kwargs), collector.args,
+             collector.post) if collector else (product, None, None, None)
+            for product, collector in self.collectors.items()]
 
         # Computing non-linear corrections
         model = self.camb.model
@@ -542,6 +578,7 @@ class CAMB(BoltzmannBase):
             (False, False): False}[(self.non_linear_sources, self.non_linear_pk)]
         # set-set base CAMB params if anything might have changed
         self._base_params = None
+        self._last_set = None
 
         must_provide: InfoDict = {
             'CAMB_transfers': {'non_linear': self.non_linear_sources,
@@ -585,53 +622,54 @@ class CAMB(BoltzmannBase):
             method=method, z_pool=z_pool, kwargs=kwargs_with_z, args=args)
 
     def calculate(self, state, want_derived=True, **params_values_dict):
+        translate = self.translate_param
         try:
             params, results = self.provider.get_CAMB_transfers()
             if self.collectors or 'sigma8' in self.derived_extra:
+                # Hoisted: every access to results.Params creates a new ctypes wrapper
+                init_power = results.Params.InitPower
                 if self.external_primordial_pk and self.needs_perts:
                     primordial_pk = self.provider.get_primordial_scalar_pk()
                     if primordial_pk.get('log_regular', True):
-                        results.Params.InitPower.set_scalar_log_regular(
+                        init_power.set_scalar_log_regular(
                             primordial_pk['kmin'], primordial_pk['kmax'],
                             primordial_pk['Pk'])
                     else:
-                        results.Params.InitPower.set_scalar_table(
+                        init_power.set_scalar_table(
                             primordial_pk['k'], primordial_pk['Pk']
                         )
-                    results.Params.InitPower.effective_ns_for_nonlinear = \
+                    init_power.effective_ns_for_nonlinear = \
                         primordial_pk.get('effective_ns_for_nonlinear', 0.97)
                     if self.extra_attrs.get("WantTensors"):
                         primordial_pk = self.provider.get_primordial_tensor_pk()
                         if primordial_pk.get('log_regular', True):
-                            results.Params.InitPower.set_tensor_log_regular(
+                            init_power.set_tensor_log_regular(
                                 primordial_pk['kmin'], primordial_pk['kmax'],
                                 primordial_pk['Pk'])
                         else:
-                            results.Params.InitPower.set_tensor_table(
+                            init_power.set_tensor_table(
                                 primordial_pk['k'], primordial_pk['Pk']
                             )
                 else:
-                    args = {self.translate_param(p): v for p, v in
+                    args = {translate(p): v for p, v in
                             params_values_dict.items() if p in self.power_params}
                     args.update(self.initial_power_args)
-                    results.Params.InitPower.set_params(**args)
+                    init_power.set_params(**args)
                 if self.non_linear_sources or self.non_linear_pk:
-                    args = {self.translate_param(p): v for p, v in
+                    args = {translate(p): v for p, v in
                             params_values_dict.items() if p in self.nonlin_params}
                     args.update(self.nonlin_args)
                     results.Params.NonLinearModel.set_params(**args)
                 results.power_spectra_from_transfer()
                 if "sigma8" in params_values_dict:
                     sigma8 = results.get_sigma8_0()
-                    results.Params.InitPower.As *= params_values_dict[
-                                                       "sigma8"] ** 2 / sigma8 ** 2
+                    init_power.As *= params_values_dict["sigma8"] ** 2 / sigma8 ** 2
                     results.power_spectra_from_transfer()
-            for product, collector in self.collectors.items():
-                if collector:
-                    state[product] = \
-                        collector.method(results, *collector.args, **collector.kwargs)
-                    if collector.post:
-                        state[product] = collector.post(*state[product])
+            for product, method, args, post in self._collector_calls:
+                if method:
+                    state[product] = method(results, *args)
+                    if post:
+                        state[product] = post(*state[product])
                 else:
                     state[product] = results.copy()
         except self.camb.baseconfig.CAMBError as e:
@@ -651,35 +689,53 @@ class CAMB(BoltzmannBase):
             # Prepare derived parameters
         intermediates = CAMBOutputs(params, results,
                                     results.get_derived_params() if results else None)
+        computed = {}
         if want_derived:
             state["derived"] = self._get_derived_output(intermediates)
-        # Prepare necessary extra derived parameters
+            computed = {translate(p): v for p, v in state["derived"].items()}
+        # Prepare necessary extra derived parameters (re-using those already computed)
         state["derived_extra"] = {
-            p: self._get_derived(p, intermediates) for p in self.derived_extra}
+            p: computed[p] if p in computed else self._get_derived(p, intermediates)
+            for p in self.derived_extra}
 
-    @staticmethod
-    def _get_derived(p, intermediates):
+    def _get_derived(self, p, intermediates):
         """
         General function to extract a single derived parameter.
 
+        Where the parameter was found is remembered, so that the search is not repeated
+        at every call.
+
         To get a parameter *from a likelihood* use `get_param` instead.
         """
-        if intermediates.derived:
-            derived = intermediates.derived.get(p, None)
+        getter = self._derived_getters.get(p)
+        if getter is not None:
+            derived = getter(intermediates)
             if derived is not None:
                 return derived
+        getter = self._find_derived_getter(p, intermediates)
+        self._derived_getters[p] = getter
+        return getter(intermediates)
+
+    @staticmethod
+    def _find_derived_getter(p, intermediates):
+        """
+        Returns a function that extracts the derived parameter ``p`` from a
+        :class:`CAMBOutputs` instance.
+        """
+        if intermediates.derived:
+            if intermediates.derived.get(p, None) is not None:
+                return lambda _intermediates: (_intermediates.derived or {}).get(p, None)
         # Specific calls, if general ones fail:
         if p == "sigma8":
-            return intermediates.results.get_sigma8_0()
+            return lambda _intermediates: _intermediates.results.get_sigma8_0()
         if p == "As":
-            return intermediates.results.Params.InitPower.As
-        try:
-            return getattr(intermediates.camb_params, p)
-        except AttributeError:
-            try:
-                return getattr(intermediates.results, p)
-            except AttributeError:
-                return getattr(intermediates.camb_params, "get_" + p, lambda: None)()
+            return attrgetter("results.Params.InitPower.As")
+        if hasattr(intermediates.camb_params, p):
+            return attrgetter("camb_params." + p)
+        if hasattr(intermediates.results, p):
+            return attrgetter("results." + p)
+        return lambda _intermediates: getattr(
+            _intermediates.camb_params, "get_" + p, lambda: None)()
 
     def _get_derived_output(self, intermediates):
         """
@@ -690,49 +746,79 @@ class CAMB(BoltzmannBase):
         To get a parameter *from a likelihood* use `get_param` instead.
         """
         derived = {}
+        translate = self.translate_param
         for p in self.output_params:
-            derived[p] = self._get_derived(self.translate_param(p), intermediates)
+            derived[p] = self._get_derived(translate(p), intermediates)
             if derived[p] is None:
                 raise LoggedError(self.log, "Derived param '%s' not implemented"
                                             " in the CAMB interface", p)
         return derived
 
+    def _get_cl_ell_factors(self, n_ell):
+        r"""
+        Returns the multipoles up to ``n_ell - 1`` and the factors needed to remove the
+        :math:`\ell`-scaling of CAMB's output for :math:`\ell \geq 1`, for the CMB
+        spectra and for the lensing potential and lensing-CMB cross spectra (stacked).
+
+        Cached, since they only depend on the ``lmax`` requested.
+        """
+        try:
+            return self._cl_ell_factors[n_ell]
+        except KeyError:
+            ls = np.arange(n_ell, dtype=np.int64)
+            ells_factor = (ls[1:] * (ls[1:] + 1)).astype(float)
+            factors = {"cl": (2 * np.pi) / ells_factor,
+                       "lens": (2 * np.pi) / np.array(
+                           [ells_factor ** 2] + 2 * [ells_factor ** (3. / 2)])}
+            for array in [ls] + list(factors.values()):
+                array.setflags(write=False)
+            self._cl_ell_factors[n_ell] = ls, factors
+            return ls, factors
+
     def _get_Cl(self, ell_factor=False, units="FIRASmuK2", lensed=True):
         which_key = "Cl" if lensed else "unlensed_Cl"
         which_result = "total" if lensed else "unlensed_total"
         which_error = "lensed" if lensed else "unlensed"
+        state = self.current_state
         try:
-            cl_camb = self.current_state[which_key][which_result].copy()
+            cl_camb_raw = state[which_key][which_result]
         except:
             raise LoggedError(self.log, "No %s Cl's were computed. Are you sure that you "
                                         "have requested them?", which_error)
         units_factor = self._cmb_unit_factor(
-            units, self.current_state['derived_extra']['TCMB'])
-        ls = np.arange(cl_camb.shape[0], dtype=np.int64)
+            units, state['derived_extra']['TCMB'])
+        ls, factors = self._get_cl_ell_factors(cl_camb_raw.shape[0])
+        # Stored as [spectrum, ell], so that each spectrum returned is contiguous
+        cl_camb = np.empty(cl_camb_raw.shape[::-1])
         if not ell_factor:
             # unit conversion and ell_factor. CAMB output is *with* the factors already
-            ells_factor = ls[1:] * (ls[1:] + 1)
-            cl_camb[1:, :] /= ells_factor[..., np.newaxis]
-            cl_camb[1:, :] *= (2 * np.pi) * units_factor ** 2
-        elif units_factor != 1:
-            cl_camb *= units_factor ** 2
-        mapping = {"tt": 0, "ee": 1, "bb": 2, "te": 3, "et": 3}
+            cl_camb[:, 0] = cl_camb_raw[0]
+            np.multiply(cl_camb_raw[1:].T, units_factor ** 2 * factors["cl"],
+                        out=cl_camb[:, 1:])
+        else:
+            np.multiply(cl_camb_raw.T, units_factor ** 2, out=cl_camb)
         cls = {"ell": ls}
-        for sp, i in mapping.items():
-            cls[sp] = cl_camb[:, i]
+        for sp, i in self._cl_columns:
+            cls[sp] = cl_camb[i]
         if lensed:
-            cl_lens: Optional[np.ndarray] = self.current_state["Cl"].get("lens_potential")
+            cl_lens: Optional[np.ndarray] = state["Cl"].get("lens_potential")
             if cl_lens is not None:
-                cls["pp"] = cl_lens[:, 0].copy()
+                # pp, and if needed pt and pe (these two with CMB units)
+                n_lens = 3 if self._needs_lensing_cross else 1
+                lens_units = np.array([1, units_factor, units_factor][:n_lens])
+                cl_lens_out = np.empty((n_lens, cl_lens.shape[0]))
                 if not ell_factor:
-                    # noinspection PyUnboundLocalVariable
-                    cls["pp"][1:] /= ells_factor ** 2 / (2 * np.pi)
+                    cl_lens_out[:, 0] = cl_lens[0, :n_lens] * lens_units
+                    np.multiply(cl_lens[1:, :n_lens].T,
+                                factors["lens"][:n_lens] * lens_units[:, np.newaxis],
+                                out=cl_lens_out[:, 1:])
+                else:
+                    np.multiply(cl_lens[:, :n_lens].T, lens_units[:, np.newaxis],
+                                out=cl_lens_out)
+                cls["pp"] = cl_lens_out[0]
                 if self._needs_lensing_cross:
                     for i, cross in enumerate(['pt', 'pe']):
-                        cls[cross] = cl_lens[:, i + 1].copy() * units_factor
-                        if not ell_factor:
-                            cls[cross][1:] /= ells_factor ** (3. / 2) / (2 * np.pi)
-                        cls[cross[::-1]] = cls[cross]
+                        cls[cross] = cls[cross[::-1]] = cl_lens_out[i + 1]
         return cls
 
     def get_Cl(self, ell_factor=False, units="FIRASmuK2"):
@@ -751,18 +837,20 @@ class CAMB(BoltzmannBase):
     def get_source_Cl(self):
         # get C_l^XX from the cosmological code
         try:
-            cls = deepcopy(self.current_state["source_Cl"])
+            cls = self.current_state["source_Cl"]
         except:
             raise LoggedError(
                 self.log, "No source Cl's were computed. "
                           "Are you sure that you have requested some source?")
         cls_dict: dict = dict()
-        for term, cl in cls.items():
-            term_tuple = tuple(
-                (lambda x: x if x == "P" else list(self.sources)[int(x) - 1])(
-                    _.strip("W")) for _ in term.split("x"))
-            cls_dict[term_tuple] = cl
-        cls_dict["ell"] = np.arange(cls[list(cls)[0]].shape[0])
+        terms = self._source_cl_terms
+        try:
+            for term, cl in cls.items():
+                cls_dict[terms[term]] = cl.copy()
+        except KeyError as excpt:
+            raise LoggedError(self.log, "Source Cl term %s returned by CAMB does not "
+                                        "correspond to any known source.", excpt)
+        cls_dict["ell"] = np.arange(next(iter(cls.values())).shape[0])
         return cls_dict
 
     def get_CAMBdata(self):
@@ -799,10 +887,43 @@ class CAMB(BoltzmannBase):
     def get_version(self):
         return self.camb.__version__
 
+    def _get_camb_method_args(self, method_name):
+        """
+        Returns the names of the arguments of the given ``CAMBparams`` method
+        (cached, since inspecting the signature is slow).
+        """
+        method = getattr(self.camb.CAMBparams, method_name)
+        try:
+            return self._camb_method_args[method]
+        except KeyError:
+            args = tuple(getfullargspec(method).args[1:])
+            self._camb_method_args[method] = args
+            return args
+
+    def _set_extra_attrs(self, params):
+        """
+        Sets the attributes in ``extra_attrs`` on the given ``CAMBparams`` instance,
+        resolving dotted names (e.g. ``Accuracy.AccurateBB``) only once per attribute.
+        """
+        for attr, value in self.extra_attrs.items():
+            parent, _, par = attr.rpartition('.')
+            obj = attrgetter(parent)(params) if parent else params
+            if not hasattr(obj, par):
+                raise LoggedError(
+                    self.log,
+                    "Some of the attributes to be set manually were not "
+                    "recognized: %s=%s", attr, value)
+            setattr(obj, par, value)
+
     def set(self, params_values_dict, state):
         # Prepare parameters to be passed: this is called from the CambTransfers instance
-        args = {self.translate_param(p): v for p, v in params_values_dict.items()}
+        translate = self.translate_param
+        args = {translate(p): v for p, v in params_values_dict.items()}
         # Generate and save
+        # Re-use the last CAMBparams if the arguments have not changed
+        key = tuple(sorted(args.items()))
+        if self._last_set is not None and self._last_set[0] == key:
+            return self._last_set[1]
         self.log.debug("Setting parameters: %r and %r", args, self.extra_args)
         try:
             if not self._base_params:
@@ -811,15 +932,13 @@ class CAMB(BoltzmannBase):
                 # Remove extra args that might
                 # cause an error if the associated product is not requested
                 if not self.extra_attrs["WantCls"]:
-                    for not_needed in getfullargspec(
-                            self.camb.CAMBparams.set_for_lmax).args[1:]:
+                    for not_needed in self._get_camb_method_args("set_for_lmax"):
                         base_args.pop(not_needed, None)
                 self._reduced_extra_args = self.extra_args.copy()
                 params = self.camb.set_params(**base_args)
                 # pre-set the parameters that are not varying
                 for non_param_func in ['set_classes', 'set_matter_power', 'set_for_lmax']:
-                    for fixed_param in getfullargspec(
-                            getattr(self.camb.CAMBparams, non_param_func)).args[1:]:
+                    for fixed_param in self._get_camb_method_args(non_param_func):
                         if fixed_param in args:
                             raise LoggedError(
                                 self.log, "Trying to sample fixed theory parameter %s",
@@ -828,22 +947,7 @@ class CAMB(BoltzmannBase):
                 if self.extra_attrs:
                     self.log.debug("Setting attributes of CAMBparams: %r",
                                    self.extra_attrs)
-                for attr, value in self.extra_attrs.items():
-                    obj = params
-                    if '.' in attr:
-                        parts = attr.split('.')
-                        for p in parts[:-1]:
-                            obj = getattr(obj, p)
-                        par = parts[-1]
-                    else:
-                        par = attr
-                    if hasattr(obj, par):
-                        setattr(obj, par, value)
-                    else:
-                        raise LoggedError(
-                            self.log,
-                            "Some of the attributes to be set manually were not "
-                            "recognized: %s=%s", attr, value)
+                self._set_extra_attrs(params)
                 # Sources
                 if getattr(self, "sources", None):
                     self.log.debug("Setting sources: %r", self.sources)
@@ -864,7 +968,12 @@ class CAMB(BoltzmannBase):
                     params.SourceTerms.limber_windows = self.limber
                 self._base_params = params
             args.update(self._reduced_extra_args)
-            return self.camb.set_params(self._base_params.copy(), **args)
+            # Needs a fresh copy: the returned CAMBparams are kept in the state (and in
+            # the transfers cache), and set_cosmology resets the arguments not passed.
+            # Primordial and non-linear parameters are set in place in CAMB.calculate.
+            params = self.camb.set_params(self._base_params.copy(), **args)
+            self._last_set = (key, params)
+            return params
         except self.camb.baseconfig.CAMBParamRangeError:
             if self.stop_at_error:
                 raise LoggedError(self.log, "Out of bound parameters: %r",
@@ -918,10 +1027,9 @@ class CAMB(BoltzmannBase):
         Returns the ``camb`` module import path if there is a compiled version of CAMB in
         the given folder. Otherwise raises ``FileNotFoundError``.
         """
-        lib_fname = "cambdll.dll" if platform.system() == "Windows" else "camblib.so"
-        if not os.path.isfile(os.path.realpath(os.path.join(path, "camb", lib_fname))):
+        if not os.path.isfile(os.path.join(path, "camb", _camb_lib_fname)):
             raise FileNotFoundError(
-                f"Could not find compiled CAMB library {lib_fname} in {path}.")
+                f"Could not find compiled CAMB library {_camb_lib_fname} in {path}.")
         return path
 
     @classmethod
@@ -951,13 +1059,22 @@ class CAMB(BoltzmannBase):
             return False
         camb_path = cls.get_path(path)
         log.info("Compiling camb...")
-        from subprocess import Popen, PIPE
+        from subprocess import Popen, PIPE, STDOUT
         process_make = Popen([sys.executable, "setup.py", "build_cluster"],
-                             cwd=camb_path, stdout=PIPE, stderr=PIPE)
-        out, err = process_make.communicate()
+                             cwd=camb_path, stdout=PIPE, stderr=STDOUT, text=True,
+                             errors="replace", bufsize=1)
+        # Stream the compilation log as it comes, keeping only its tail for errors
+        log_tail: deque = deque(maxlen=200)
+        assert process_make.stdout
+        for line in process_make.stdout:
+            line = line.rstrip()
+            log.debug(line)
+            log_tail.append(line)
+        process_make.wait()
         if process_make.returncode:
-            log.info(out.decode())
-            log.info(err.decode())
+            log.info("Showing the last %d lines of the compilation log; "
+                     "rerun with --debug for the full log:\n%s",
+                     len(log_tail), "\n".join(log_tail))
             gcc_check = check_gcc_version(cls._camb_min_gcc_version, error_returns=False)
             if not gcc_check:
                 cause = (" Possible cause: it looks like `gcc` does not have the correct "
@@ -983,6 +1100,16 @@ class CambTransfers(HelperTheory):
         self.cobaya_camb = cobaya_camb
         self.camb = cobaya_camb.camb
         self.speed = self.cobaya_camb.speed * 1.5
+        # Transfer functions computed at (nearly) the same parameters, by least recent use
+        self._results_cache = OrderedDict()
+        self._results_cache_size = int(cobaya_camb.transfers_cache_size or 0)
+        if self._results_cache_size:
+            digits = cobaya_camb.transfers_cache_digits
+            if not isinstance(digits, numbers.Integral) or digits < 1:
+                raise LoggedError(
+                    self.log, "'transfers_cache_digits' must be a positive integer; "
+                              "got %r.", digits)
+            self._results_cache_digits = int(digits)
 
     def get_can_support_params(self):
         supported_params = self.camb.get_valid_numerical_params(
@@ -1002,6 +1129,7 @@ class CambTransfers(HelperTheory):
 
     def must_provide(self, **requirements):
         super().must_provide(**requirements)
+        self._results_cache.clear()
         opts = requirements.get('CAMB_transfers')
         if opts:
             self.non_linear_sources = opts['non_linear']
@@ -1011,7 +1139,24 @@ class CambTransfers(HelperTheory):
     def get_CAMB_transfers(self):
         return self.current_state['results']
 
+    def _results_cache_key(self, params_values_dict):
+        """
+        Key of the cache of transfer functions: parameter values rounded to the number of
+        significant digits given by ``transfers_cache_digits``.
+        """
+        decimals = self._results_cache_digits - 1
+        return tuple((p, "%.*e" % (decimals, v) if isinstance(v, numbers.Real) else v)
+                     for p, v in sorted(params_values_dict.items()))
+
     def calculate(self, state, want_derived=True, **params_values_dict):
+        if self._results_cache_size:
+            key = self._results_cache_key(params_values_dict)
+            cached = self._results_cache.get(key)
+            if cached is not None:
+                self.log.debug("Re-using transfer functions computed for %r", key)
+                self._results_cache.move_to_end(key)
+                state['results'] = cached
+                return
         # Set parameters
         camb_params = self.cobaya_camb.set(params_values_dict, state)
         # Failed to set parameters but no error raised
@@ -1029,6 +1174,11 @@ class CambTransfers(HelperTheory):
                 results = self.camb.get_transfer_functions(camb_params) \
                     if self.needs_perts else self.camb.get_background(camb_params)
             state['results'] = (camb_params, results)
+            if self._results_cache_size:
+                # noinspection PyUnboundLocalVariable
+                self._results_cache[key] = state['results']
+                if len(self._results_cache) > self._results_cache_size:
+                    self._results_cache.popitem(last=False)
         except self.camb.baseconfig.CAMBError as e:
             if self.stop_at_error:
                 self.log.error(
@@ -480,7 +480,8 @@ class classy(BoltzmannBase):
             for k in ["non_linear"]:
                 self.extra_args.pop(k, None)
         # Prepare parameters to be passed: this-iteration + extra
-        args = {self.translate_param(p): v for p, v in params_values_dict.items()}
+        translate = self.translate_param
+        args = {translate(p): v for p, v in params_values_dict.items()}
         args.update(self.extra_args)
         # Generate and save
         self.log.debug("Setting parameters: %r", args)
@@ -531,7 +532,7 @@ class classy(BoltzmannBase):
                     # if more than one vectorised arg, assume all vectorised in parallel
                     n_values = len(self.collectors[product].args[arg_array[0]])
                     state[product] = np.zeros(n_values)
-                    args = deepcopy(list(self.collectors[product].args))
+                    args = list(self.collectors[product].args)
                     for i in range(n_values):
                         for arg_arr_index in arg_array:
                             args[arg_arr_index] = \
@@ -545,7 +546,7 @@ class classy(BoltzmannBase):
                     x_and_y = np.array(np.meshgrid(
                         self.collectors[product].args[arg_array[0, 0]],
                         self.collectors[product].args[arg_array[1, 0]])).T
-                    args = deepcopy(list(self.collectors[product].args))
+                    args = list(self.collectors[product].args)
                     result = np.empty(shape=x_and_y.shape[:2])
                     for i, row in enumerate(x_and_y):
                         for j, column_element in enumerate(x_and_y[i]):
@@ -562,7 +563,7 @@ class classy(BoltzmannBase):
                 value = np.atleast_1d(self.collectors[product].kwargs[arg_array])
                 state[product] = np.zeros(value.shape)
                 for i, v in enumerate(value):
-                    kwargs = deepcopy(self.collectors[product].kwargs)
+                    kwargs = dict(self.collectors[product].kwargs)
                     kwargs[arg_array] = v
                     state[product][i] = method(
                         *self.collectors[product].args, **kwargs)
@@ -576,7 +577,7 @@ class classy(BoltzmannBase):
         if want_derived:
             state["derived"] = {p: d.get(p) for p in self.output_params}
             # Prepare necessary extra derived parameters
-        state["derived_extra"] = deepcopy(d_extra)
+        state["derived_extra"] = dict(d_extra)
 
     def _get_derived_all(self, derived_requested=True):
         """
@@ -618,8 +619,9 @@ class classy(BoltzmannBase):
     def _get_Cl(self, ell_factor=False, units="FIRASmuK2", lensed=True):
         which_key = "Cl" if lensed else "unlensed_Cl"
         which_error = "lensed" if lensed else "unlensed"
+        state = self.current_state
         try:
-            cls = deepcopy(self.current_state[which_key])
+            cls = {k: v.copy() for k, v in state[which_key].items()}
         except:
             raise LoggedError(self.log, "No %s Cl's were computed. Are you sure that you "
                                         "have requested them?", which_error)
@@ -627,7 +629,7 @@ class classy(BoltzmannBase):
         ells_factor = \
             ((cls["ell"] + 1) * cls["ell"] / (2 * np.pi))[2:] if ell_factor else 1
         units_factor = self._cmb_unit_factor(
-            units, self.current_state['derived_extra']['T_cmb'])
+            units, state['derived_extra']['T_cmb'])
         for cl in cls:
             if cl not in ['pp', 'ell']:
                 cls[cl][2:] *= units_factor ** 2 * ells_factor
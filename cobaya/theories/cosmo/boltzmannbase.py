@@ -34,6 +34,8 @@ class BoltzmannBase(Theory):
         # Additional input parameters to pass to CAMB, and attributes to set_ manually
         self.extra_args = deepcopy_where_possible(self.extra_args) or {}
         self._must_provide = {}
+        # Keys of matter power products in the state, indexed by the arguments as given
+        self._pk_keys = {}
 
     def initialize_with_params(self):
         self.check_no_repeated_input_extra()
@@ -46,12 +48,21 @@ class BoltzmannBase(Theory):
 
     def get_param(self, p):
         translated = self.translate_param(p)
-        for pool in ["params", "derived", "derived_extra"]:
-            value = (self.current_state[pool] or {}).get(translated, None)
-            if value is not None:
-                return value
-
-        raise LoggedError(self.log, "Parameter not known: '%s'", p)
+        state = self.current_state
+        # Input, derived and extra derived parameters merged into a single dict,
+        # created the first time a parameter is requested for this state
+        params = state.get("_all_params")
+        if params is None:
+            params = {}
+            # in reverse order of precedence, so that the first non-None value is kept
+            for pool in ["derived_extra", "derived", "params"]:
+                params.update((q, v) for q, v in (state.get(pool) or {}).items()
+                              if v is not None)
+            state["_all_params"] = params
+        try:
+            return params[translated]
+        except KeyError:
+            raise LoggedError(self.log, "Parameter not known: '%s'", p)
 
     def _norm_vars_pairs(self, vars_pairs, name):
         # Empty list: default to *total matter*: CMB + Baryon + MassiveNu
@@ -119,6 +130,10 @@ class BoltzmannBase(Theory):
         - ``Pk_grid={...}``: similar to ``Pk_interpolator`` except that rather than
           returning a bicubic spline object it returns the raw power spectrum grid as
           a ``(k, z, P(z,k))`` set of arrays. Get with :func:`~BoltzmannBase.get_Pk_grid`.
+        - ``Pk_on_grid={...}``: same arguments as ``Pk_interpolator``, for likelihoods
+          that evaluate the interpolated power spectrum on a fixed set of :math:`(z, k)`.
+          The values are computed once per set of parameters and shared among those
+          requesting the same grid. Get with :func:`~BoltzmannBase.get_Pk_on_grid`.
         - ``sigma_R={...}``: RMS linear fluctuation in spheres of radius :math:`R` at
           redshifts :math:`z`. Takes ``"z": [list_of_evaluated_redshifts]``,
           ``"k_max": [k_max]``, ``"vars_pairs": [["delta_tot", "delta_tot"],  [...]]``,
@@ -181,7 +196,7 @@ class BoltzmannBase(Theory):
                         "z": combine_1d(v["z"], current.get("z")),
                         "k_max": max(current.get("k_max", 0),
                                      v.get("k_max", 2 / np.min(v["R"])))}
-            elif k in ("Pk_interpolator", "Pk_grid"):
+            elif k in ("Pk_interpolator", "Pk_grid", "Pk_on_grid"):
                 # arguments are all identical, collect all in Pk_grid
                 self._check_args(k, v, ('z', 'k_max'))
                 redshifts = v.pop("z")
@@ -276,7 +291,8 @@ class BoltzmannBase(Theory):
             raise LoggedError(self.log, f"{quantity} not computed for all z requested. "
                                         f"Requested z are {z}, but computed ones are "
                                         f"{pool.values}.")
-        return np.array(self.current_state[quantity], copy=True)[i_kwarg_z]
+        # indices are an integer array, so fancy indexing already returns a copy
+        return np.asarray(self.current_state[quantity])[i_kwarg_z]
 
     def _get_z_pair_dependent(self, quantity, z_pairs, inv_value=0):
         """
@@ -299,7 +315,7 @@ class BoltzmannBase(Theory):
                           f"Requested z are {z_pairs}, but computed ones are "
                           f"{pool.values}.")
         result = np.full(len(z_pairs), inv_value, dtype=float)
-        result[i_right] = np.array(self.current_state[quantity], copy=True)[i_z_pair]
+        result[i_right] = np.asarray(self.current_state[quantity])[i_z_pair]
         return result
 
     def _cmb_unit_factor(self, units, T_cmb):
@@ -353,12 +369,12 @@ class BoltzmannBase(Theory):
         The available units are ``"km/s/Mpc"`` (i.e. :math:`cH(\mathrm(Mpc)^{-1})`) and
         ``1/Mpc``.
         """
-        try:
-            return self._get_z_dependent("Hubble", z) * H_units_conv_factor[units]
-        except KeyError:
+        factor = H_units_conv_factor.get(units)
+        if factor is None:
             raise LoggedError(
                 self.log, "Units not known for H: '%s'. Try instead one of %r.",
                 units, list(H_units_conv_factor))
+        return self._get_z_dependent("Hubble", z) * factor
 
     def get_Omega_b(self, z):
         r"""
@@ -438,33 +454,98 @@ class BoltzmannBase(Theory):
                             to ``extrap_kmax``.
         :return: :class:`PowerSpectrumInterpolator` instance.
         """
-        nonlinear = bool(nonlinear)
-        key = (("Pk_interpolator", nonlinear, extrap_kmin, extrap_kmax) +
-               tuple(sorted(var_pair)))
-        if key in self.current_state:
-            return self.current_state[key]
+        key = self._get_Pk_key("Pk_interpolator", nonlinear, var_pair,
+                               extrap_kmin, extrap_kmax)
+        state = self.current_state
+        try:
+            return state[key]
+        except KeyError:
+            pass
         k, z, pk = self.get_Pk_grid(var_pair=var_pair, nonlinear=nonlinear)
-        log_p = True
-        sign = 1
-        if np.any(pk < 0):
-            if np.all(pk < 0):
-                sign = -1
-            else:
-                log_p = False
+        # The sign and log of the grid are shared by interpolators differing only in
+        # their extrapolation limits
+        log_key = self._get_Pk_key("Pk_log_grid", nonlinear, var_pair)
+        try:
+            log_p, sign, pk = state[log_key]
+        except KeyError:
+            log_p = True
+            sign = 1
+            if pk.min() < 0:
+                if pk.max() < 0:
+                    sign = -1
+                else:
+                    log_p = False
+            if log_p:
+                if sign > 0:
+                    pk = np.log(pk)
+                else:
+                    pk = np.negative(pk)
+                    np.log(pk, out=pk)
+                pk.setflags(write=False)
+            state[log_key] = log_p, sign, pk
         extrapolating = ((extrap_kmax and extrap_kmax > k[-1]) or
                          (extrap_kmin and extrap_kmin < k[0]))
-        if log_p:
-            pk = np.log(sign * pk)
-        elif extrapolating:
+        if not log_p and extrapolating:
             raise LoggedError(self.log,
                               'Cannot do log extrapolation with zero-crossing pk '
                               'for %s, %s' % var_pair)
         result = PowerSpectrumInterpolator(
             z, k, pk, logP=log_p, logsign=sign,
             extrap_kmin=extrap_kmin, extrap_kmax=extrap_kmax)
-        self.current_state[key] = result
+        state[key] = result
+        return result
+
+    def get_Pk_on_grid(self, z, k, var_pair=("delta_tot", "delta_tot"), nonlinear=True,
+                       extrap_kmin=None, extrap_kmax=None):
+        r"""
+        Get the interpolated :math:`P(z,k)` on the grid given by the 1-d arrays of
+        redshifts ``z`` and wavenumbers ``k`` (in :math:`1/\mathrm{Mpc}`), in any order.
+
+        The result is cached for the current parameters, so that likelihoods agreeing on
+        a common grid share a single evaluation of the interpolator.
+
+        Takes the same keyword arguments as :func:`~BoltzmannBase.get_Pk_interpolator`.
+
+        :return: read-only 2-d array ``Pk[i,j]`` with the value of :math:`P(z,k)`
+                 at ``z[i]``, ``k[j]``, in :math:`\mathrm{Mpc}^3`.
+        """
+        z = np.atleast_1d(np.asarray(z, dtype=float))
+        k = np.atleast_1d(np.asarray(k, dtype=float))
+        key = self._get_Pk_key("Pk_on_grid", nonlinear, var_pair,
+                               extrap_kmin, extrap_kmax) + (z.tobytes(), k.tobytes())
+        state = self.current_state
+        try:
+            return state[key]
+        except KeyError:
+            pass
+        interpolator = self.get_Pk_interpolator(
+            var_pair=var_pair, nonlinear=nonlinear,
+            extrap_kmin=extrap_kmin, extrap_kmax=extrap_kmax)
+        if np.all(np.diff(z) >= 0) and np.all(np.diff(k) >= 0):
+            result = interpolator.P(z, k, grid=True)
+        else:
+            # grid evaluation needs sorted points: sort, and restore the given order
+            z_order, k_order = np.argsort(z), np.argsort(k)
+            result = interpolator.P(z[z_order], k[k_order], grid=True)[
+                np.ix_(np.argsort(z_order), np.argsort(k_order))]
+        result.setflags(write=False)
+        state[key] = result
         return result
 
+    def _get_Pk_key(self, name, nonlinear, var_pair, *args):
+        """
+        Returns the state key ``(name, bool(nonlinear), *args, *sorted(var_pair))`` of a
+        matter power product, memoized by the arguments as given (if hashable).
+        """
+        try:
+            return self._pk_keys[(name, nonlinear, var_pair) + args]
+        except KeyError:
+            key = (name, bool(nonlinear)) + args + tuple(sorted(var_pair))
+            self._pk_keys[(name, nonlinear, var_pair) + args] = key
+            return key
+        except TypeError:  # e.g. var_pair given as a list
+            return (name, bool(nonlinear)) + args + tuple(sorted(var_pair))
+
     def get_Pk_grid(self, var_pair=("delta_tot", "delta_tot"), nonlinear=True):
         r"""
         Get  matter power spectrum, e.g. suitable for splining.
@@ -483,8 +564,7 @@ class BoltzmannBase(Theory):
                  ``k[j]``.
         """
         try:
-            return self.current_state[
-                ("Pk_grid", bool(nonlinear)) + tuple(sorted(var_pair))]
+            return self.current_state[self._get_Pk_key("Pk_grid", nonlinear, var_pair)]
         except KeyError:
             if ("Pk_grid", False) + tuple(sorted(var_pair)) in self.current_state:
                 raise LoggedError(self.log,
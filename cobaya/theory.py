@@ -30,7 +30,7 @@ see :doc:`theories_and_dependencies`.
 
 """
 
-from collections import deque
+from collections import OrderedDict
 from typing import Sequence, Optional, Union, Tuple, Dict, Iterable, Set, Any, List
 # Local
 from cobaya.typing import TheoryDictIn, TheoriesDict, InfoDict, ParamValuesDict, \
@@ -54,7 +54,7 @@ class Theory(CobayaComponent):
     input_params: Sequence[str] = unset_params
     output_params: Sequence[str] = unset_params
 
-    _states: deque
+    _states: OrderedDict
 
     def __init__(self, info: TheoryDictIn = empty_dict,
                  name: Optional[str] = None, timing: Optional[bool] = None,
@@ -214,7 +214,8 @@ class Theory(CobayaComponent):
         """
         Set how many states to cache
         """
-        self._states = deque(maxlen=n)
+        self._cache_size = n
+        self._states = OrderedDict()
 
     def check_cache_and_compute(self, params_values_dict,
                                 dependency_params=None, want_derived=False, cached=True):
@@ -232,17 +233,16 @@ class Theory(CobayaComponent):
                 zip(self._input_params_extra,
                     self.provider.get_param(self._input_params_extra)))
         self.log.debug("Got parameters %r", params_values_dict)
-        state = None
-        if cached:
-            for _state in self._states:
-                if _state["params"] == params_values_dict and \
-                        _state["dependency_params"] == dependency_params \
-                        and (not want_derived or _state["derived"] is not None):
-                    state = _state
-                    self.log.debug("Re-using computed results")
-                    self._states.remove(_state)
-                    break
-        if not state:
+        # States are stored by least recent use, indexed by the values of the parameters
+        key = (tuple(sorted(params_values_dict.items())),
+               None if dependency_params is None else tuple(dependency_params))
+        state = self._states.get(key) if cached else None
+        if state is not None and want_derived and state["derived"] is None:
+            state = None
+        if state is not None:
+            self.log.debug("Re-using computed results")
+            self._states.move_to_end(key)
+        else:
             self.log.debug("Computing new state")
             state = {"params": params_values_dict,
                      "dependency_params": dependency_params,
@@ -266,8 +266,11 @@ class Theory(CobayaComponent):
                     return False
             if self.timer:
                 self.timer.increment(self.log)
-        # make this state the current one
-        self._states.appendleft(state)
+            # make this state the most recently used one, dropping the oldest if needed
+            self._states[key] = state
+            self._states.move_to_end(key)
+            if len(self._states) > self._cache_size:
+                self._states.popitem(last=False)
         self._current_state = state
         return True
 
@@ -1035,11 +1035,11 @@ def combine_1d(new_list, old_list=None):
     If `old_list` given, it is assumed to be a sorted and uniquified array (e.g. the
     output of this function when passed as first argument).
 
-    Uses `np.unique`, which distinguishes numbers up to machine precision.
+    Uses `np.union1d`/`np.unique`, which distinguish numbers up to machine precision.
     """
     new_list = np.atleast_1d(new_list)
     if old_list is not None:
-        new_list = np.concatenate((old_list, new_list))
+        return np.union1d(old_list, new_list)
     return np.unique(new_list)
 
 
@@ -1058,6 +1058,8 @@ class PoolND(ABC):
     """
 
     values: np.ndarray
+    # Maximum number of cached results of find_indices
+    _max_found_indices = 128
 
     def __init__(self, values=(),
                  rtol_min=1e-5, rtol_max=1e-3, atol_min=1e-8, atol_max=1e-6, logger=None):
@@ -1113,6 +1115,8 @@ class PoolND(ABC):
         values = self._check_values(values)
         self._update_values(values)
         self._update_tolerances()
+        # Indices found for previously requested values, invalid once the pool changes
+        self._found_indices = {}
 
     @abstractmethod
     def _check_values(self, values):
@@ -1139,8 +1143,22 @@ class PoolND(ABC):
         limits.
 
         Raises ValueError if not all elements were found, each only once.
+
+        Results are cached, since the same values tend to be requested repeatedly. The
+        returned array of indices is read-only.
         """
         values = self._check_values(values)
+        key = (values.dtype.str, values.shape, values.tobytes())
+        indices = self._found_indices.get(key)
+        if indices is None:
+            indices = self._find_indices(values)
+            indices.setflags(write=False)
+            if len(self._found_indices) >= self._max_found_indices:
+                self._found_indices.clear()
+            self._found_indices[key] = indices
+        return indices
+
+    def _find_indices(self, values):
         # Fast search first if possible
         indices = self._fast_find_indices(values)
         i_not_found = np.where(indices == -1)[0]
@@ -1321,22 +1339,16 @@ class Pool2D(PoolND):
 
     def _update_values(self, values):
         self.values = combine_2d(values, getattr(self, "values", None))
+        # numpy sorts complex numbers lexicographically, as the pairs in the pool
+        self._values_as_complex = self.values[:, 0] + 1j * self.values[:, 1]
 
     def _check_values(self, values):
         return check_2d(values)
 
     def _fast_find_indices(self, values):
-        # first, locate 1st component
-        i_insert_left = np.clip(np.searchsorted(self.values[:, 0], values[:, 0]),
-                                a_min=None, a_max=len(self) - 1)
-        # we do not need to clip the "right" index, because we will use it as an endpoint
-        # for a slice, which is safe
-        i_insert_right = np.searchsorted(self.values[:, 0], values[:, 0], side="right")
-        slices = np.array([i_insert_left, i_insert_right]).T
-        i_maybe_found = [
-            slices[i][0] + np.searchsorted(
-                self.values[slices[i][0]:slices[i][1], 1], values[i][1])
-            for i in range(len(values))]
+        i_maybe_found = np.clip(
+            np.searchsorted(self._values_as_complex, values[:, 0] + 1j * values[:, 1]),
+            a_min=None, a_max=len(self) - 1)
         return np.where(
             self._cond_isclose(
                 self.values[i_maybe_found], values, rtol=self._adapt_rtol_min,
@@ -1,8 +1,10 @@
 from .common import process_packages_path
 from .conftest import install_test_wrapper
 import os
+import pytest
 import numpy as np
 from cobaya.model import get_model
+from cobaya.log import LoggedError
 from cobaya.tools import load_module
 from cobaya.component import ComponentNotInstalledError
 
@@ -129,3 +131,54 @@ def test_CAMB_sigma_R(packages_path, skip_not_installed):
         {'external': test_likelihood, 'requires': test_likelihood_requires},
         skip_not_installed)
     model.loglike()
+
+
+def test_CAMB_transfers_cache(packages_path, skip_not_installed):
+    # noinspection PyDefaultArgument
+    def test_likelihood(_self):
+        return _self.provider.get_Hubble(0.5)[0]
+
+    info = {
+        'params': {**params, 'H0': {'prior': {'min': 60, 'max': 80}}},
+        'likelihood': {'test_likelihood': {'external': test_likelihood,
+                                           'requires': {'Hubble': {'z': [0.5]}}}},
+        'theory': {'camb': {'stop_at_error': True, 'transfers_cache_size': 2}},
+        'packages_path': process_packages_path(packages_path)}
+    model = install_test_wrapper(skip_not_installed, get_model, info)
+    transfers = model.theory['camb']._camb_transfers
+    H_67 = model.loglike({'H0': 67})[0]
+    H_68 = model.loglike({'H0': 68})[0]
+    assert not np.isclose(H_67, H_68)
+    # Nearly-equal parameters reuse the transfer functions of the closest computed point
+    results = transfers.current_state['results']
+    assert model.loglike({'H0': 68 * (1 + 1e-12)})[0] == H_68
+    assert transfers.current_state['results'] is results
+    assert model.loglike({'H0': 67 * (1 - 1e-12)})[0] == H_67
+    assert len(transfers._results_cache) == 2
+    info['theory']['camb']['transfers_cache_digits'] = 0
+    with pytest.raises(LoggedError):
+        install_test_wrapper(skip_not_installed, get_model, info)
+
+
+def test_CAMB_set_reused(packages_path, skip_not_installed):
+    # noinspection PyDefaultArgument
+    def test_likelihood(_self):
+        return _self.provider.get_Hubble(0.5)[0]
+
+    info = {
+        'params': {**params, 'H0': {'prior': {'min': 60, 'max': 80}}},
+        'likelihood': {'test_likelihood': {'external': test_likelihood,
+                                           'requires': {'Hubble': {'z': [0.5]}}}},
+        'theory': {'camb': {'stop_at_error': True}},
+        'packages_path': process_packages_path(packages_path)}
+    model = install_test_wrapper(skip_not_installed, get_model, info)
+    transfers = model.theory['camb']._camb_transfers
+    H_67 = model.loglike({'H0': 67}, return_derived=False)
+    camb_params, results = transfers.current_state['results']
+    # The state has no derived parameters, so the transfers are computed again,
+    # re-using the CAMBparams of the last call with the same arguments
+    assert model.loglike({'H0': 67})[0] == H_67
+    assert transfers.current_state['results'][0] is camb_params
+    assert transfers.current_state['results'][1] is not results
+    assert model.loglike({'H0': 68})[0] != H_67
+    assert transfers.current_state['results'][0] is not camb_params
@@ -197,3 +197,25 @@ def test_cosmo_weyl_pkz_camb(packages_path, skip_not_installed):
 @pytest.mark.skip
 def test_cosmo_weyl_pkz_classy(packages_path, skip_not_installed):
     _test_cosmo_weyl_pkz("classy", packages_path, skip_not_installed)
+
+
+def _test_cosmo_pk_on_grid(theo, packages_path, skip_not_installed):
+    reqs = {"Pk_on_grid": {"z": zs, "k_max": max(ks), "vars_pairs": var_pair}}
+    model = _get_model_with_requirements_and_eval(
+        theo, reqs, packages_path, skip_not_installed)
+    theory = model.theory[theo]
+    k_grid, z_grid, pk_grid = theory.get_Pk_grid(var_pair=var_pair)
+    # interpolation must reproduce the computed grid at its nodes, in any order
+    i_z = [len(z_grid) - 1, 0, len(z_grid) // 2]
+    i_k = [len(k_grid) // 3, len(k_grid) - 1, 0, 2 * len(k_grid) // 3]
+    pk = theory.get_Pk_on_grid(z_grid[i_z], k_grid[i_k], var_pair=var_pair)
+    assert pk.shape == (len(i_z), len(i_k))
+    np.testing.assert_allclose(pk, pk_grid[np.ix_(i_z, i_k)], rtol=1e-8)
+    pk_sorted = theory.get_Pk_on_grid(z_grid, k_grid, var_pair=var_pair)
+    np.testing.assert_allclose(pk_sorted, pk_grid, rtol=1e-8)
+    # cached for the same grid
+    assert theory.get_Pk_on_grid(list(z_grid), k_grid, var_pair=var_pair) is pk_sorted
+
+
+def test_cosmo_pk_on_grid_camb(packages_path, skip_not_installed):
+    _test_cosmo_pk_on_grid("camb", packages_path, skip_not_installed)
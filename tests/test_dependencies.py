@@ -273,3 +273,52 @@ def test_conditional_dependencies():
     with pytest.raises(LoggedError) as e, NoLogging(logging.ERROR):
         _test_loglike2(theories)
     assert "Circular dependency" in str(e.value)
+
+
+class Counted(Theory):
+    params = {'x': None}
+
+    def initialize(self):
+        self.n_calculate = 0
+
+    def calculate(self, state, want_derived=True, **params_values_dict):
+        self.n_calculate += 1
+        state['xout'] = params_values_dict['x']
+
+    def get_xout(self):
+        return self.current_state['xout']
+
+
+class LikeX(Likelihood):
+
+    def get_requirements(self):
+        return {'xout'}
+
+    def calculate(self, state, want_derived=True, **params_values_dict):
+        state['logp'] = -self.provider.get_xout() ** 2
+
+
+def test_cache_states():
+    model = get_model({'likelihood': {'like': LikeX}, 'theory': {'counted': Counted},
+                       'params': {'x': {'prior': {'min': 0, 'max': 10}}},
+                       'debug': debug})
+    theory = model.theory['counted']
+    model.set_cache_size(2)
+    # re-used when cached, and least recently used state dropped when full
+    for x, n_calculate in [(1, 1), (2, 2), (1, 2), (3, 3), (2, 4), (1, 5)]:
+        assert model.loglikes({'x': x}, return_derived=False)[0] == -x ** 2
+        assert theory.n_calculate == n_calculate, "wrong caching at x=%g" % x
+    # states computed without derived parameters are recomputed if those are needed
+    model.loglikes({'x': 1})
+    assert theory.n_calculate == 6
+    model.loglikes({'x': 1})
+    model.loglikes({'x': 1}, return_derived=False)
+    assert theory.n_calculate == 6
+    # not cached: computed again, replacing the stored state
+    model.loglikes({'x': 1}, cached=False)
+    assert theory.n_calculate == 7
+    state = theory.current_state
+    model.loglikes({'x': 2}, return_derived=False)
+    model.loglikes({'x': 1})
+    assert theory.n_calculate == 7
+    assert theory.current_state is state
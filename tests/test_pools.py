@@ -68,3 +68,19 @@ def test_pool2d_fail():
     test_values = [2, 2]  # out of range
     with pytest.raises(ValueError):
         pool.find_indices(test_values)
+
+
+def test_pool2d_shared_first_component():
+    # beyond the last pair, with the same first component as it
+    pool = Pool2D([[0.1, 0.5], [0.5, 1], [0.5, 2]])
+    with pytest.raises(ValueError):
+        pool.find_indices([[0.5, 3]])
+    assert np.all(pool.find_indices([[0.5, 2], [0.1, 0.5], [0.5, 1]]) == [2, 0, 1])
+
+
+def test_pool1d_cached_indices_after_update():
+    pool = Pool1D([0.1, 0.5, 1.])
+    assert np.all(pool.find_indices([0.5, 1.]) == [1, 2])
+    assert np.all(pool.find_indices([0.5, 1.]) == [1, 2])
+    pool.update([0.3])
+    assert np.all(pool.find_indices([0.5, 1.]) == [2, 3])